@@ -1,16 +1,4 @@
 import streamlit as st
-from supabase import create_client, Client
-import os
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
-
-# Initialize Supabase client
-supabase: Client = create_client(
-    supabase_url=os.getenv("SUPABASE_URL"),
-    supabase_key=os.getenv("SUPABASE_KEY")
-)
 
 def initialize_session_state():
     """Initialize session state variables"""
@@ -0,0 +1,13 @@
+from typing import NamedTuple
+
+class DashboardBundle(NamedTuple):
+    """Aggregate metrics and charts the dashboard renders, built under one cache entry.
+
+    Defined here rather than in the page script so disk-persisted cache entries
+    unpickle across reruns and server restarts. Holds counts only; candidate names
+    are PII and stay out of anything persisted to disk.
+    """
+    metrics: dict
+    fig_jobs: str
+    fig_loc: str
+    fig_skills: str
@@ -0,0 +1,68 @@
+import os
+import httpx
+import streamlit as st
+from supabase import create_client, Client
+from postgrest import AsyncPostgrestClient
+from postgrest.utils import SyncClient
+from dotenv import load_dotenv
+
+@st.cache_resource
+def load_env():
+    """Load .env once per process instead of on every script rerun"""
+    load_dotenv()
+
+# Load environment variables
+load_env()
+
+# Supabase settings, read once at import rather than on every client build
+SUPABASE_URL = os.environ.get("SUPABASE_URL")
+SUPABASE_KEY = os.environ.get("SUPABASE_KEY")
+SUPABASE_SERVICE_KEY = os.environ.get("SUPABASE_SERVICE_ROLE_KEY")
+# Optional PostgREST endpoint override, e.g. one fronted by the transaction-mode pooler
+POSTGREST_URL = os.environ.get("POSTGREST_URL")
+# Only the user_profiles columns the pages use; avoids select('*') on user_profiles
+PROFILE_COLUMNS = 'user_id, full_name, company, role, phone, linkedin'
+
+_ADMIN_HEADERS = {
+    "apikey": SUPABASE_SERVICE_KEY,
+    "Authorization": f"Bearer {SUPABASE_SERVICE_KEY}"
+}
+
+@st.cache_resource(max_entries=5)  # Limit to 5 instances
+def get_supabase_client() -> Client:
+    """Get the shared service role Supabase client, created once per process"""
+    client = create_client(
+        supabase_url=SUPABASE_URL,
+        supabase_key=SUPABASE_SERVICE_KEY
+    )
+    # Set the headers explicitly
+    client.postgrest.headers = _ADMIN_HEADERS
+    # Swap the PostgREST transport for an HTTP/2 one so queries share a single
+    # multiplexed connection, with a bounded pool for concurrent sessions whose idle
+    # connections stay open for a minute between reruns; httpx already sends
+    # Accept-Encoding: gzip
+    session = client.postgrest.session
+    client.postgrest.session = SyncClient(
+        base_url=POSTGREST_URL or session.base_url,
+        headers=session.headers,
+        timeout=session.timeout,
+        limits=httpx.Limits(max_connections=10, max_keepalive_connections=5, keepalive_expiry=60.0),
+        http2=True
+    )
+    session.close()
+    return client
+
+@st.cache_resource(max_entries=5)  # Limit to 5 instances
+def get_anon_supabase_client() -> Client:
+    """Get the shared anon key Supabase client, used for sign in and sign up"""
+    return create_client(
+        supabase_url=SUPABASE_URL,
+        supabase_key=SUPABASE_KEY
+    )
+
+def create_async_postgrest_client() -> AsyncPostgrestClient:
+    """Create a service role async PostgREST client; the caller owns its lifetime"""
+    return AsyncPostgrestClient(
+        POSTGREST_URL or f"{SUPABASE_URL}/rest/v1",
+        headers=_ADMIN_HEADERS
+    )
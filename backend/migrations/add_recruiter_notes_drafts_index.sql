@@ -0,0 +1,15 @@
+-- Composite index for the drafts page query:
+--   WHERE recruiter_id = ? AND contact_status = false ORDER BY created_at DESC LIMIT n
+-- Partial on contact_status = false, since drafts are the only rows the page reads;
+-- the predicate already fixes contact_status, so it is left out of the key columns.
+-- Run outside a transaction block (CONCURRENTLY does not lock writes).
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_recruiter_notes_drafts
+    ON recruiter_notes (recruiter_id, created_at DESC, id DESC)
+    WHERE contact_status = false;
+
+-- Verify the drafts page now uses an Index Scan instead of Bitmap Heap Scan + Sort:
+-- EXPLAIN ANALYZE
+-- SELECT id FROM recruiter_notes
+-- WHERE recruiter_id = '<recruiter uuid>' AND contact_status = false
+-- ORDER BY created_at DESC
+-- LIMIT 5;
@@ -0,0 +1,8 @@
+-- One profile per user; also required for upserts with on_conflict=user_id
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_constraint
+                  WHERE conname = 'user_profiles_user_id_key') THEN
+        ALTER TABLE user_profiles ADD CONSTRAINT user_profiles_user_id_key UNIQUE (user_id);
+    END IF;
+END $$;
@@ -0,0 +1,166 @@
+-- Keep dashboard counts incrementally up to date instead of re-aggregating
+-- the whole resumes table (and re-unnesting every skills array) per request.
+CREATE TABLE IF NOT EXISTS dashboard_counters (
+    kind TEXT NOT NULL,   -- 'total', 'job_title', 'location' or 'skill'
+    key TEXT NOT NULL,
+    count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (kind, key)
+);
+
+-- Create index for the ORDER BY count DESC lookups
+CREATE INDEX IF NOT EXISTS idx_dashboard_counters_kind_count ON dashboard_counters(kind, count DESC);
+
+-- Enable Row Level Security; only the trigger below writes the counters
+ALTER TABLE dashboard_counters ENABLE ROW LEVEL SECURITY;
+
+-- Create policies
+DROP POLICY IF EXISTS "Enable read access for authenticated users" ON dashboard_counters;
+CREATE POLICY "Enable read access for authenticated users" ON dashboard_counters
+    FOR SELECT
+    TO authenticated
+    USING (true);
+
+-- Add delta to one counter, dropping it once it reaches zero
+CREATE OR REPLACE FUNCTION bump_dashboard_counter(p_kind TEXT, p_key TEXT, p_delta INTEGER)
+RETURNS VOID AS $$
+BEGIN
+    IF p_key IS NULL OR p_key = '' THEN
+        RETURN;
+    END IF;
+
+    INSERT INTO dashboard_counters (kind, key, count)
+    VALUES (p_kind, p_key, p_delta)
+    ON CONFLICT (kind, key) DO UPDATE SET count = dashboard_counters.count + EXCLUDED.count;
+
+    DELETE FROM dashboard_counters
+    WHERE kind = p_kind AND key = p_key AND count <= 0;
+END;
+$$ LANGUAGE plpgsql SET search_path = public;
+
+-- Apply one resume row's contribution to the counters with the given sign
+CREATE OR REPLACE FUNCTION apply_resume_to_dashboard_counters(r resumes, p_delta INTEGER)
+RETURNS VOID AS $$
+DECLARE
+    skill TEXT;
+BEGIN
+    PERFORM bump_dashboard_counter('total', 'all', p_delta);
+    PERFORM bump_dashboard_counter('job_title', r.current_or_last_job_title, p_delta);
+    PERFORM bump_dashboard_counter('location', r.location, p_delta);
+    FOR skill IN SELECT unnest(r.skills) LOOP
+        PERFORM bump_dashboard_counter('skill', skill, p_delta);
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql SET search_path = public;
+
+-- SECURITY DEFINER runs with the owner's rights, so pin search_path to keep a caller
+-- from shadowing dashboard_counters or the helpers with objects in their own schema
+CREATE OR REPLACE FUNCTION update_dashboard_counters()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM apply_resume_to_dashboard_counters(OLD, -1);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM apply_resume_to_dashboard_counters(NEW, 1);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+-- Create trigger to keep the counters in step with resumes
+DROP TRIGGER IF EXISTS update_dashboard_counters ON resumes;
+CREATE TRIGGER update_dashboard_counters
+    AFTER INSERT OR DELETE OR UPDATE OF current_or_last_job_title, location, skills ON resumes
+    FOR EACH ROW
+    EXECUTE FUNCTION update_dashboard_counters();
+
+-- The counters replace the dashboard_metrics view, so stop refreshing it on every
+-- write to resumes and drop it; nothing reads it anymore
+DROP TRIGGER IF EXISTS refresh_dashboard_metrics_insert ON resumes;
+DROP TRIGGER IF EXISTS refresh_dashboard_metrics_update ON resumes;
+DROP TRIGGER IF EXISTS refresh_dashboard_metrics_delete ON resumes;
+DROP FUNCTION IF EXISTS refresh_dashboard_metrics();
+-- Earlier migrations leave it either materialized or plain, and DROP errors on the other kind
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_matviews WHERE schemaname = 'public' AND matviewname = 'dashboard_metrics') THEN
+        DROP MATERIALIZED VIEW dashboard_metrics;
+    ELSIF EXISTS (SELECT 1 FROM pg_views WHERE schemaname = 'public' AND viewname = 'dashboard_metrics') THEN
+        DROP VIEW dashboard_metrics;
+    END IF;
+END $$;
+
+-- Backfill from the existing rows
+TRUNCATE dashboard_counters;
+INSERT INTO dashboard_counters (kind, key, count)
+SELECT 'total', 'all', COUNT(*) FROM resumes
+UNION ALL
+SELECT 'job_title', current_or_last_job_title, COUNT(*)
+FROM resumes
+WHERE current_or_last_job_title IS NOT NULL AND current_or_last_job_title != ''
+GROUP BY current_or_last_job_title
+UNION ALL
+SELECT 'location', location, COUNT(*)
+FROM resumes
+WHERE location IS NOT NULL AND location != ''
+GROUP BY location
+UNION ALL
+SELECT 'skill', skill, COUNT(*)
+FROM resumes, LATERAL unnest(skills) AS skill
+WHERE skill IS NOT NULL AND skill != ''
+GROUP BY skill;
+
+-- Read the counts from dashboard_counters; only the recent list still touches resumes
+CREATE OR REPLACE FUNCTION get_dashboard_metrics()
+RETURNS JSON AS $$
+    SELECT json_build_object(
+        -- Total candidates
+        'total_candidates', COALESCE((SELECT count FROM dashboard_counters WHERE kind = 'total' AND key = 'all'), 0),
+
+        -- Job title metrics
+        'job_title_counts', (
+            SELECT COALESCE(json_object_agg(key, count), '{}'::json)
+            FROM dashboard_counters
+            WHERE kind = 'job_title'
+        ),
+
+        -- Location metrics
+        'location_counts', (
+            SELECT COALESCE(json_object_agg(key, count), '{}'::json)
+            FROM dashboard_counters
+            WHERE kind = 'location'
+        ),
+
+        -- Skills metrics
+        'skill_counts', (
+            SELECT COALESCE(json_object_agg(key, count), '{}'::json)
+            FROM dashboard_counters
+            WHERE kind = 'skill'
+        ),
+
+        -- Recent candidates
+        'recent_candidates', (
+            SELECT COALESCE(json_agg(recent ORDER BY recent.created_at DESC), '[]'::json)
+            FROM (
+                SELECT
+                    r.id,
+                    rp.full_name,
+                    r.current_or_last_job_title,
+                    r.location,
+                    r.created_at
+                FROM resumes r
+                LEFT JOIN resumes_pii rp ON r.id = rp.resume_id
+                ORDER BY r.created_at DESC
+                LIMIT 5
+            ) recent
+        )
+    );
+$$ LANGUAGE sql STABLE;
+
+-- Grant access to the counters and the function
+REVOKE INSERT, UPDATE, DELETE, TRUNCATE ON dashboard_counters FROM anon, authenticated;
+GRANT SELECT ON dashboard_counters TO authenticated;
+-- The helpers are only for the trigger, which runs them as the owner; keep them off /rpc
+REVOKE EXECUTE ON FUNCTION bump_dashboard_counter(TEXT, TEXT, INTEGER) FROM PUBLIC, anon, authenticated;
+REVOKE EXECUTE ON FUNCTION apply_resume_to_dashboard_counters(resumes, INTEGER) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION get_dashboard_metrics() TO authenticated, service_role;
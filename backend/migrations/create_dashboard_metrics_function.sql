@@ -0,0 +1,61 @@
+-- Aggregate the home dashboard metrics server-side so the app no longer
+-- downloads every resume row just to count job titles, locations and skills.
+CREATE OR REPLACE FUNCTION get_dashboard_metrics()
+RETURNS JSON AS $$
+    SELECT json_build_object(
+        -- Total candidates
+        'total_candidates', (SELECT COUNT(*) FROM resumes),
+
+        -- Job title metrics
+        'job_title_counts', (
+            SELECT COALESCE(json_object_agg(current_or_last_job_title, count), '{}'::json)
+            FROM (
+                SELECT current_or_last_job_title, COUNT(*) AS count
+                FROM resumes
+                WHERE current_or_last_job_title IS NOT NULL AND current_or_last_job_title != ''
+                GROUP BY current_or_last_job_title
+            ) job_title_stats
+        ),
+
+        -- Location metrics
+        'location_counts', (
+            SELECT COALESCE(json_object_agg(location, count), '{}'::json)
+            FROM (
+                SELECT location, COUNT(*) AS count
+                FROM resumes
+                WHERE location IS NOT NULL AND location != ''
+                GROUP BY location
+            ) location_stats
+        ),
+
+        -- Skills metrics
+        'skill_counts', (
+            SELECT COALESCE(json_object_agg(skill, count), '{}'::json)
+            FROM (
+                SELECT skill, COUNT(*) AS count
+                FROM resumes, LATERAL unnest(skills) AS skill
+                GROUP BY skill
+            ) skill_stats
+        ),
+
+        -- Recent candidates
+        'recent_candidates', (
+            SELECT COALESCE(json_agg(recent ORDER BY recent.created_at DESC), '[]'::json)
+            FROM (
+                SELECT
+                    r.id,
+                    rp.full_name,
+                    r.current_or_last_job_title,
+                    r.location,
+                    r.created_at
+                FROM resumes r
+                LEFT JOIN resumes_pii rp ON r.id = rp.resume_id
+                ORDER BY r.created_at DESC
+                LIMIT 5
+            ) recent
+        )
+    );
+$$ LANGUAGE sql STABLE;
+
+-- Grant access to the function
+GRANT EXECUTE ON FUNCTION get_dashboard_metrics() TO authenticated, service_role;
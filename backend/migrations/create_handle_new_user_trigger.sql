@@ -0,0 +1,23 @@
+-- Create each user's default profile in Postgres when the auth user is created,
+-- instead of inserting it from the signup and profile pages
+CREATE OR REPLACE FUNCTION public.handle_new_user()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO public.user_profiles (user_id, full_name, company, role, phone, linkedin, created_at)
+    VALUES (NEW.id, split_part(NEW.email, '@', 1), '', '', '', '', TIMEZONE('utc'::text, NOW()))
+    ON CONFLICT (user_id) DO NOTHING;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+DROP TRIGGER IF EXISTS on_auth_user_created ON auth.users;
+CREATE TRIGGER on_auth_user_created
+    AFTER INSERT ON auth.users
+    FOR EACH ROW
+    EXECUTE FUNCTION public.handle_new_user();
+
+-- Backfill profiles for users that signed up before the trigger existed
+INSERT INTO public.user_profiles (user_id, full_name, company, role, phone, linkedin, created_at)
+SELECT u.id, split_part(u.email, '@', 1), '', '', '', '', TIMEZONE('utc'::text, NOW())
+FROM auth.users u
+ON CONFLICT (user_id) DO NOTHING;
@@ -0,0 +1,65 @@
+-- Return only the top entries the dashboard charts show, already ordered by
+-- count, instead of every long-tail job title, location and skill.
+CREATE OR REPLACE FUNCTION get_dashboard_metrics()
+RETURNS JSON AS $$
+    SELECT json_build_object(
+        -- Total candidates
+        'total_candidates', COALESCE((SELECT count FROM dashboard_counters WHERE kind = 'total' AND key = 'all'), 0),
+
+        -- Top 10 job titles
+        'job_title_counts', (
+            SELECT COALESCE(json_object_agg(key, count ORDER BY count DESC, key), '{}'::json)
+            FROM (
+                SELECT key, count
+                FROM dashboard_counters
+                WHERE kind = 'job_title'
+                ORDER BY count DESC, key
+                LIMIT 10
+            ) top_job_titles
+        ),
+
+        -- Top 8 locations
+        'location_counts', (
+            SELECT COALESCE(json_object_agg(key, count ORDER BY count DESC, key), '{}'::json)
+            FROM (
+                SELECT key, count
+                FROM dashboard_counters
+                WHERE kind = 'location'
+                ORDER BY count DESC, key
+                LIMIT 8
+            ) top_locations
+        ),
+
+        -- Top 15 skills
+        'skill_counts', (
+            SELECT COALESCE(json_object_agg(key, count ORDER BY count DESC, key), '{}'::json)
+            FROM (
+                SELECT key, count
+                FROM dashboard_counters
+                WHERE kind = 'skill'
+                ORDER BY count DESC, key
+                LIMIT 15
+            ) top_skills
+        ),
+
+        -- Recent candidates
+        'recent_candidates', (
+            SELECT COALESCE(json_agg(recent ORDER BY recent.created_at DESC), '[]'::json)
+            FROM (
+                SELECT
+                    r.id,
+                    rp.full_name,
+                    r.current_or_last_job_title,
+                    r.location,
+                    r.created_at
+                FROM resumes r
+                LEFT JOIN resumes_pii rp ON r.id = rp.resume_id
+                ORDER BY r.created_at DESC
+                LIMIT 5
+            ) recent
+        )
+    );
+$$ LANGUAGE sql STABLE;
+
+-- Grant access to the function
+GRANT EXECUTE ON FUNCTION get_dashboard_metrics() TO authenticated, service_role;
@@ -0,0 +1,49 @@
+-- Home reads Recent Activity through its own in-memory cached query, so stop
+-- building recent_candidates here; it joined resumes_pii on every dashboard load
+-- only to ship candidate names nobody read.
+CREATE OR REPLACE FUNCTION get_dashboard_metrics()
+RETURNS JSON AS $$
+    SELECT json_build_object(
+        -- Total candidates
+        'total_candidates', COALESCE((SELECT count FROM dashboard_counters WHERE kind = 'total' AND key = 'all'), 0),
+
+        -- Top 10 job titles
+        'job_title_counts', (
+            SELECT COALESCE(json_object_agg(key, count ORDER BY count DESC, key), '{}'::json)
+            FROM (
+                SELECT key, count
+                FROM dashboard_counters
+                WHERE kind = 'job_title'
+                ORDER BY count DESC, key
+                LIMIT 10
+            ) top_job_titles
+        ),
+
+        -- Top 8 locations
+        'location_counts', (
+            SELECT COALESCE(json_object_agg(key, count ORDER BY count DESC, key), '{}'::json)
+            FROM (
+                SELECT key, count
+                FROM dashboard_counters
+                WHERE kind = 'location'
+                ORDER BY count DESC, key
+                LIMIT 8
+            ) top_locations
+        ),
+
+        -- Top 15 skills
+        'skill_counts', (
+            SELECT COALESCE(json_object_agg(key, count ORDER BY count DESC, key), '{}'::json)
+            FROM (
+                SELECT key, count
+                FROM dashboard_counters
+                WHERE kind = 'skill'
+                ORDER BY count DESC, key
+                LIMIT 15
+            ) top_skills
+        )
+    );
+$$ LANGUAGE sql STABLE;
+
+-- Grant access to the function
+GRANT EXECUTE ON FUNCTION get_dashboard_metrics() TO authenticated, service_role;
@@ -18,9 +18,9 @@ import uuid
 logger = logging.getLogger(__name__)
 
 class ResumeProcessor:
-    def __init__(self):
+    def __init__(self, supabase_client=None):
         logger.info("Initializing ResumeProcessor")
-        self.supabase = SupabaseClient()
+        self.supabase = SupabaseClient(supabase_client)
         self.openai = OpenAIClient()
         self.parser = ResumeParser()
         self.pii_processor = PIIProcessor()
@@ -14,9 +14,10 @@ from datetime import timedelta
 logger = logging.getLogger(__name__)
 
 class SupabaseClient:
-    def __init__(self):
+    def __init__(self, client: Optional[Client] = None):
         logger.info("Initializing SupabaseClient")
-        self._client = None
+        # An existing client (e.g. the app's shared one) is reused; otherwise one is created lazily
+        self._client = client
         self._project_ref = None
         self._local_cache = {}
 
@@ -1,27 +1,8 @@
 import streamlit as st
-from supabase import create_client, Client
-import os
-from dotenv import load_dotenv
 from datetime import datetime, UTC
 import pandas as pd
 import time
-
-# Load environment variables
-load_dotenv()
-
-# Initialize Supabase client with caching
-@st.cache_resource(max_entries=5)  # Limit to 5 instances
-def get_supabase_client():
-    client = create_client(
-        supabase_url=os.environ.get("SUPABASE_URL"),
-        supabase_key=os.environ.get("SUPABASE_SERVICE_ROLE_KEY")
-    )
-    # Set the headers explicitly
-    client.postgrest.headers = {
-        "apikey": os.environ.get("SUPABASE_SERVICE_ROLE_KEY"),
-        "Authorization": f"Bearer {os.environ.get('SUPABASE_SERVICE_ROLE_KEY')}"
-    }
-    return client
+from backend.db import get_supabase_client
 
 def initialize_session_state():
     """Initialize session state variables"""
@@ -1,7 +1,6 @@
 import streamlit as st
 from supabase import create_client, Client
 import os
-from dotenv import load_dotenv
 import json
 from datetime import datetime, UTC
 import pandas as pd
@@ -9,6 +8,7 @@ import logging
 import time
 import uuid
 from functools import lru_cache
+from backend.db import get_supabase_client, load_env
 
 # Configure logging
 logging.basicConfig(
@@ -18,14 +18,9 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # Load environment variables
-load_dotenv()
-
-# Initialize clients with caching
-@st.cache_resource(max_entries=5)  # Limit to 5 instances
-def get_supabase_client():
-    from backend.supabase_client import SupabaseClient
-    return SupabaseClient()
+load_env()
 
+# Initialize clients with caching; Supabase uses the shared service role client from backend.db
 @st.cache_resource(max_entries=5)  # Limit to 5 instances
 def get_openai_client():
     from backend.openai_client import OpenAIClient
@@ -760,7 +755,7 @@ def main():
         st.session_state.last_query = None
         st.session_state.current_filters = None
         st.session_state.trigger_search = False
-        st.switch_page("login.py")
+        st.switch_page("pages/login.py")
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -1,26 +1,27 @@
 import streamlit as st
-from supabase import create_client, Client
-import os
-from dotenv import load_dotenv
 from datetime import datetime, UTC
 import pandas as pd
-import time
 from slugify import slugify
-
-# Load environment variables
-load_dotenv()
-
-# Initialize Supabase client
-supabase: Client = create_client(
-    supabase_url=os.environ.get("SUPABASE_URL"),
-    supabase_key=os.environ.get("SUPABASE_SERVICE_ROLE_KEY")
+from functools import lru_cache
+import asyncio
+import httpx
+import logging
+from backend.db import get_supabase_client, create_async_postgrest_client, PROFILE_COLUMNS
+
+logger = logging.getLogger(__name__)
+
+# Candidate names repeat across reruns, so memoize their anchor IDs
+slugify_cached = lru_cache(maxsize=1024)(slugify)
+
+# Only the columns rendered on the page; avoids select('*') on recruiter_notes
+DRAFT_LIST_COLUMNS = (
+    'id, recruiter_id, candidate_id, created_at, updated_at, contact_status, '
+    'follow_up_required, follow_up_date, '
+    'resumes!inner(current_or_last_job_title, location, resumes_pii!inner(full_name, email, phone))'
 )
 
-# Set the headers explicitly
-supabase.postgrest.headers = {
-    "apikey": os.environ.get("SUPABASE_SERVICE_ROLE_KEY"),
-    "Authorization": f"Bearer {os.environ.get('SUPABASE_SERVICE_ROLE_KEY')}"
-}
+# Columns the recruiter can edit in the drafts table
+EDITABLE_COLUMNS = ['Contacted', 'Follow-up Required', 'Follow-up Date']
 
 def initialize_session_state():
     """Initialize session state variables"""
@@ -32,46 +33,84 @@ def initialize_session_state():
         st.session_state.drafts_page = 1
     if 'drafts_per_page' not in st.session_state:
         st.session_state.drafts_per_page = 5
-    if 'refresh_key' not in st.session_state:
-        st.session_state.refresh_key = time.time()
     if 'drafts_df' not in st.session_state:
         st.session_state.drafts_df = None
+    if 'drafts_df_original' not in st.session_state:
+        st.session_state.drafts_df_original = None
     if 'selected_draft' not in st.session_state:
         st.session_state.selected_draft = None
+    if 'open_draft_id' not in st.session_state:
+        st.session_state.open_draft_id = None
+    if 'pending_scroll' not in st.session_state:
+        st.session_state.pending_scroll = None
 
+# Raises instead of reporting errors so a failed fetch is never cached or rendered from here
 @st.cache_data(ttl=300, show_spinner=False)
-def get_drafts(recruiter_id, page=1, per_page=5, refresh_key=None):
-    """Get drafts with pagination"""
-    try:
-        # Calculate offset
-        offset = (page - 1) * per_page
+def fetch_drafts(recruiter_id, page=1, per_page=5):
+    """Fetch a page of drafts and the total draft count"""
+    supabase = get_supabase_client()
+
+    # Calculate offset
+    offset = (page - 1) * per_page
+    
+    # Get drafts with their details, joining with resumes_pii for PII data
+    response = supabase.table('recruiter_notes')\
+        .select(DRAFT_LIST_COLUMNS)\
+        .eq('recruiter_id', recruiter_id)\
+        .eq('contact_status', False)\
+        .order('created_at', desc=True)\
+        .range(offset, offset + per_page - 1)\
+        .execute()
         
-        # Get drafts with their details, joining with resumes_pii for PII data
-        response = supabase.table('recruiter_notes')\
-            .select('*, resumes!inner(current_or_last_job_title, location, resumes_pii!inner(full_name, email, phone))')\
-            .eq('recruiter_id', recruiter_id)\
-            .eq('contact_status', False)\
-            .order('created_at', desc=True)\
-            .range(offset, offset + per_page - 1)\
-            .execute()
-            
-        if not response.data:
-            return [], 0
-            
-        # Get total count for pagination
-        count_response = supabase.table('recruiter_notes')\
-            .select('id', count='exact')\
-            .eq('recruiter_id', recruiter_id)\
-            .eq('contact_status', False)\
-            .execute()
-            
-        total_count = count_response.count if count_response.count is not None else 0
+    if not response.data:
+        return [], 0
         
-        return response.data, total_count
+    # Get total count for pagination
+    count_response = supabase.table('recruiter_notes')\
+        .select('id', count='exact')\
+        .eq('recruiter_id', recruiter_id)\
+        .eq('contact_status', False)\
+        .execute()
+        
+    total_count = count_response.count if count_response.count is not None else 0
+    
+    return response.data, total_count
+
+def get_drafts(recruiter_id, page=1, per_page=5):
+    """Get drafts with pagination"""
+    try:
+        return fetch_drafts(recruiter_id, page, per_page)
     except Exception as e:
         st.error(f"Error fetching drafts: {str(e)}")
         return [], 0
 
+def prefetch_drafts(recruiter_id, page, per_page):
+    """Warm the drafts cache for a page without rendering anything; a failure is simply retried on navigation"""
+    try:
+        fetch_drafts(recruiter_id, page, per_page)
+    except Exception:
+        pass
+
+# Raises instead of reporting errors so a failed fetch is never cached as an empty body
+@st.cache_data(ttl=300, show_spinner=False)
+def fetch_draft_body(draft_id):
+    """Fetch the outreach message and screening questions for a single draft"""
+    supabase = get_supabase_client()
+    response = supabase.table('recruiter_notes')\
+        .select('outreach_message, screening_questions')\
+        .eq('id', draft_id)\
+        .single()\
+        .execute()
+    return response.data
+
+def get_draft_body(draft_id):
+    """Get the outreach message and screening questions for a single draft, or None if they could not be loaded"""
+    try:
+        return fetch_draft_body(draft_id)
+    except Exception as e:
+        st.error(f"Error fetching draft details: {str(e)}")
+        return None
+
 def format_timestamp(timestamp):
     """Format timestamp to readable string"""
     try:
@@ -80,6 +119,61 @@ def format_timestamp(timestamp):
     except:
         return timestamp
 
+def format_timestamps(series):
+    """Format a column of timestamps to readable strings in one vectorized pass"""
+    formatted = pd.to_datetime(series, utc=True, errors='coerce', format='ISO8601').dt.strftime('%Y-%m-%d %H:%M')
+    return formatted.fillna(series)
+
+def get_changed_rows(edited_df, original_df, cols=EDITABLE_COLUMNS):
+    """Return the rows of edited_df whose editable columns differ from original_df"""
+    edited = edited_df[cols]
+    original = original_df[cols]
+    # Treat two missing values as equal so untouched empty dates are not flagged
+    changed_mask = ((edited != original) & ~(edited.isna() & original.isna())).any(axis=1)
+    return edited_df[changed_mask]
+
+def prepare_drafts(drafts):
+    """Resolve each draft's nested resume/PII fields once so render code can reuse them"""
+    for d in drafts:
+        r = d.get('resumes') or {}
+        p = (r.get('resumes_pii') or [{}])[0]
+        d['_pii'] = p
+        d['_role'] = r.get('current_or_last_job_title', 'N/A')
+        d['_loc'] = r.get('location', 'N/A')
+        d['_name'] = str(p.get('full_name', '') or '')
+        d['_anchor'] = slugify_cached(d['_name'])
+    return drafts
+
+async def _save_all(payloads):
+    """Send one update per draft concurrently so latency is ~1 round trip, not N"""
+    async with create_async_postgrest_client() as client:
+        return await asyncio.gather(*(
+            client.table('recruiter_notes').update(p).eq('id', p['id']).execute()
+            for p in payloads
+        ))
+
+@st.cache_data(ttl=300, show_spinner=False)
+def build_table_df(drafts_key, _drafts):
+    """Flatten drafts into the overview table, rebuilt only when drafts_key changes"""
+    drafts = _drafts
+    flat = pd.json_normalize(drafts)
+
+    pii = pd.DataFrame.from_records([d['_pii'] for d in drafts]).reindex(columns=['full_name', 'email', 'phone'])
+
+    df = pd.DataFrame({
+        'Select': False,  # Always start unselected
+        'Candidate Name': pii['full_name'].fillna('N/A'),
+        'Current Role': flat['_role'].fillna('N/A'),
+        'Location': flat['_loc'].fillna('N/A'),
+        'Email': pii['email'].fillna('N/A'),
+        'Phone': pii['phone'].fillna('N/A'),
+        'Contacted': flat['contact_status'].fillna(False).astype(bool),
+        'Follow-up Required': flat['follow_up_required'].fillna(False).astype(bool),
+        'Follow-up Date': pd.to_datetime(flat['follow_up_date'], errors='coerce', utc=True, format='ISO8601').dt.date,
+        'Last Updated': format_timestamps(flat['updated_at'].fillna(flat['created_at']))
+    })
+    return df
+
 def copy_to_clipboard(text):
     """Copy text to clipboard using JavaScript"""
     js = f"""
@@ -93,21 +187,26 @@ def copy_to_clipboard(text):
     """
     st.components.v1.html(js, height=0)
 
-def get_user_profile(refresh_key=None):
-    """Get user profile from Supabase"""
+# Raises on a missing row so neither errors nor misses are cached
+@st.cache_data(ttl=300, show_spinner=False)
+def _fetch_profile(user_id):
+    """Fetch the user's profile row"""
+    supabase = get_supabase_client()
+    profile_response = supabase.table('user_profiles').select(PROFILE_COLUMNS).eq('user_id', user_id).maybe_single().execute()
+    
+    # maybe_single returns the row itself, or no data when there is none
+    if not profile_response or not profile_response.data:
+        raise LookupError(f"No profile for user {user_id}")
+    return profile_response.data
+
+def get_user_profile(user_id):
+    """Get user profile, reusing the row login or the profile page left in session state"""
+    profile = st.session_state.get('user_profile')
+    if profile and profile.get('user_id') == user_id:
+        return profile
     try:
-        # Get user ID from session state
-        if not st.session_state.get('user_id'):
-            print("❌ No user_id in session state")
-            return None
-        
-        user_id = st.session_state.user_id
-        
-        # Get the profile data
-        profile_response = supabase.table('user_profiles').select('*').eq('user_id', user_id).execute()
-        
-        if profile_response.data:
-            return profile_response.data[0]
+        return _fetch_profile(user_id)
+    except LookupError:
         return None
     except Exception as e:
         st.error(f"Error fetching profile: {str(e)}")
@@ -122,6 +221,7 @@ def main():
     
     # Initialize session state
     initialize_session_state()
+    supabase = get_supabase_client()
     
     # Check if user is authenticated
     if not st.session_state.authenticated:
@@ -130,16 +230,15 @@ def main():
             st.switch_page("pages/login.py")
         return
 
-    # Get user ID and profile
-    user_response = supabase.auth.get_user()
-    if not user_response.user:
+    # Get user ID from the session (set at login) instead of an auth round trip
+    recruiter_id = st.session_state.get('user_id')
+    if not recruiter_id:
         st.error("Please log in to view drafts")
         if st.button("Go to Login"):
             st.switch_page("pages/login.py")
         return
     
-    recruiter_id = user_response.user.id
-    profile = get_user_profile(st.session_state.get("refresh_key"))
+    profile = get_user_profile(recruiter_id)
     
     if not profile:
         st.error("Error loading profile. Please try logging in again.")
@@ -157,60 +256,38 @@ def main():
 
     # Add refresh button
     if st.button("🔄 Refresh"):
-        st.session_state.refresh_key = time.time()
+        fetch_drafts.clear()
+        fetch_draft_body.clear()
         st.session_state.selected_draft = None
         st.session_state.drafts_df = None  # Clear it so it can be recreated clean
+        st.session_state.drafts_df_original = None
         st.rerun()
 
     # Get drafts with pagination
     drafts, total_count = get_drafts(
         recruiter_id,
         st.session_state.drafts_page,
-        st.session_state.drafts_per_page,
-        st.session_state.refresh_key
+        st.session_state.drafts_per_page
     )
 
     if not drafts:
         st.info("No drafts found. Start by creating outreach messages for candidates.")
         return
 
+    # Index drafts by their anchor ID so the selected draft is a single lookup
+    prepare_drafts(drafts)
+    by_anchor = {d['_anchor']: d for d in drafts}
+
     # Create a table of drafts
     st.subheader("📋 Drafts Overview")
     
-    # Prepare data for the table
-    table_data = []
-    for draft in drafts:
-        resume = draft['resumes']
-        pii_data = resume['resumes_pii'][0] if resume.get('resumes_pii') and len(resume['resumes_pii']) > 0 else {}
-        # Create a unique anchor ID for each draft
-        full_name = str(pii_data.get('full_name', '') or '')
-        anchor_id = slugify(full_name)
-        try:
-            follow_up_date = pd.to_datetime(draft.get('follow_up_date')).date() if draft.get('follow_up_date') else None
-        except (ValueError, TypeError):
-            follow_up_date = None
-            
-        table_data.append({
-            'Select': False,  # Initialize as False
-            'Candidate Name': pii_data.get('full_name', 'N/A'),
-            'Current Role': resume.get('current_or_last_job_title', 'N/A'),
-            'Location': resume.get('location', 'N/A'),
-            'Email': pii_data.get('email', 'N/A'),
-            'Phone': pii_data.get('phone', 'N/A'),
-            'Contacted': draft.get('contact_status', False),
-            'Follow-up Required': draft.get('follow_up_required', False),
-            'Follow-up Date': follow_up_date,
-            'Last Updated': format_timestamp(draft.get('updated_at', draft['created_at']))
-        })
-    
-    # Create DataFrame
-    df = pd.DataFrame(table_data)
+    # Prepare data for the table; ids + updated_at identify the page's content
+    drafts_key = tuple((d['id'], d.get('updated_at')) for d in drafts)
+    df = build_table_df(drafts_key, drafts)
 
-    # Always reset Select column to False
-    df["Select"] = False
-
-    # Store the dataframe in session state
+    # Store the dataframe in session state, plus a pristine copy to diff edits against
     st.session_state.drafts_df = df
+    st.session_state.drafts_df_original = df.copy(deep=True)
     
     # Display the dataframe with editable columns
     edited_df = st.data_editor(
@@ -285,119 +362,115 @@ def main():
                 # Get the selected draft's name and convert to ID format
                 selected_name = selected.iloc[0].get('Candidate Name', '')
                 if isinstance(selected_name, str):
-                    st.session_state.selected_draft = selected_name.lower().replace(' ', '-')
+                    st.session_state.selected_draft = slugify_cached(selected_name)
                 else:
                     st.session_state.selected_draft = ''
                 
-                # Add JavaScript to scroll to the selected draft's section
-                js = f"""
-                <script>
-                    // Function to scroll to element
-                    function scrollToElement() {{
-                        const element = document.getElementById('{st.session_state.selected_draft}');
-                        if (element) {{
-                            // Scroll to the element with smooth behavior
-                            element.scrollIntoView({{ behavior: 'smooth', block: 'start' }});
-                            // Add some padding to the top
-                            window.scrollBy(0, -20);
-                        }}
-                    }}
-
-                    // Try to scroll immediately
-                    scrollToElement();
-
-                    // Also try after a short delay to ensure everything is loaded
-                    setTimeout(scrollToElement, 500);
-                    
-                    // And try again after a longer delay
-                    setTimeout(scrollToElement, 1000);
-                </script>
-                """
-                st.components.v1.html(js, height=0)
+                # Scroll on the next run, once the selected draft's anchor has been rendered
+                st.session_state.pending_scroll = st.session_state.selected_draft
                 st.rerun()
 
     # Save changes to follow-up status
     if st.button("💾 Save Changes"):
         try:
-            # Get the current state of the dataframe
-            updated_df = edited_df
-            
-            # Update each draft's status
-            for i, row in updated_df.iterrows():
+            # Only write the drafts whose editable values actually changed
+            updated_df = get_changed_rows(edited_df, st.session_state.drafts_df_original)
+            if updated_df.empty:
+                st.info("No changes to save.")
+            else:
+                now_iso = datetime.now(UTC).isoformat()
+
+                # Convert all follow-up dates to ISO format with timezone in one pass
+                follow_up_dates = pd.to_datetime(updated_df['Follow-up Date'], errors='coerce').dt.tz_localize('UTC')
+                follow_up_iso = follow_up_dates.dt.strftime('%Y-%m-%dT%H:%M:%S+00:00')\
+                    .astype(object)\
+                    .where(follow_up_dates.notna(), None)
+
+                # Build one payload for all drafts so they are written in a single request
+                payload = []
+                for i, row in updated_df.iterrows():
+                    draft = drafts[i]
+                    payload.append({
+                        'id': draft['id'],
+                        # Upsert inserts before resolving the conflict, so NOT NULL columns must be present
+                        'recruiter_id': draft['recruiter_id'],
+                        'candidate_id': draft['candidate_id'],
+                        'contact_status': bool(row['Contacted']),
+                        'follow_up_required': bool(row['Follow-up Required']),
+                        'follow_up_date': follow_up_iso[i],
+                        'updated_at': now_iso
+                    })
+
                 try:
-                    # Convert the date to ISO format with timezone
-                    if pd.notna(row['Follow-up Date']):
-                        # Convert to datetime and format with timezone
-                        follow_up_date = pd.to_datetime(row['Follow-up Date']).tz_localize('UTC').isoformat()
-                    else:
-                        follow_up_date = None
-                except (AttributeError, ValueError) as e:
-                    st.error(f"Error processing date: {str(e)}")
-                    follow_up_date = None
-                    
-                data = {
-                    'contact_status': bool(row['Contacted']),
-                    'follow_up_required': bool(row['Follow-up Required']),
-                    'follow_up_date': follow_up_date,
-                    'updated_at': datetime.now(UTC).isoformat()
-                }
-                
-                response = supabase.table('recruiter_notes')\
-                    .update(data)\
-                    .eq('id', drafts[i]['id'])\
-                    .execute()
-                
-                if hasattr(response, 'error') and response.error:
-                    st.error(f"Error updating status: {response.error}")
-                    return
-            
-            st.success("Changes saved successfully!")
-            st.session_state.refresh_key = time.time()
-            st.rerun()
+                    responses = [
+                        supabase.table('recruiter_notes')\
+                            .upsert(payload, on_conflict='id')\
+                            .execute()
+                    ]
+                except httpx.HTTPError:
+                    # Only a transport failure is worth retrying; an error PostgREST returned
+                    # would fail the same way per draft, so that one propagates below
+                    logger.warning("Bulk draft upsert failed, retrying per draft", exc_info=True)
+                    # Fall back to per-draft updates, issued concurrently rather than one after another
+                    responses = asyncio.run(_save_all(payload))
+
+                for response in responses:
+                    if hasattr(response, 'error') and response.error:
+                        st.error(f"Error updating status: {response.error}")
+                        return
+
+                st.success("Changes saved successfully!")
+                fetch_drafts.clear()
+                st.rerun()
             
         except Exception as e:
             st.error(f"Error updating status: {str(e)}")
             st.error("Please try again or contact support if the issue persists.")
 
     # Display selected candidate details at the top first
-    if st.session_state.selected_draft:
-        selected_draft_obj = next(
-            (d for d in drafts if str(d.get('resumes', {}).get('resumes_pii', [{}])[0].get('full_name', '') or '').lower().replace(' ', '-') == st.session_state.selected_draft),
-            None
-        )
-        if selected_draft_obj:
-            resume = selected_draft_obj.get('resumes', {})
-            pii_data = resume.get('resumes_pii', [{}])[0] if resume.get('resumes_pii') else {}
-            full_name = str(pii_data.get('full_name', '') or '')
-            st.subheader("📝 Selected Draft Details")
-            with st.expander(f"👤 {full_name or 'N/A'} - {resume.get('current_or_last_job_title', 'N/A')}", expanded=True):
-                # Candidate summary
-                st.markdown("#### Candidate Summary")
-                col1, col2 = st.columns(2)
-                with col1:
-                    st.markdown(f"**Name:** {pii_data.get('full_name', 'N/A')}")
-                    st.markdown(f"**Current Role:** {resume.get('current_or_last_job_title', 'N/A')}")
-                    st.markdown(f"**Location:** {resume.get('location', 'N/A')}")
-                with col2:
-                    st.markdown(f"**Email:** {pii_data.get('email', 'N/A')}")
-                    st.markdown(f"**Phone:** {pii_data.get('phone', 'N/A')}")
-                
+    selected_draft_obj = by_anchor.get(st.session_state.selected_draft)
+    if selected_draft_obj:
+        pii_data = selected_draft_obj['_pii']
+        full_name = selected_draft_obj['_name']
+        st.subheader("📝 Selected Draft Details")
+        draft_body = get_draft_body(selected_draft_obj['id'])
+        with st.expander(f"👤 {full_name or 'N/A'} - {selected_draft_obj['_role']}", expanded=True):
+            st.markdown(f'<div id="{selected_draft_obj["_anchor"]}"></div>', unsafe_allow_html=True)
+            # Scroll to the anchor now that it exists. The component iframe is same-origin but
+            # may not navigate the top page, so scroll the element directly instead of via the hash
+            if st.session_state.pending_scroll == selected_draft_obj['_anchor']:
+                js = f"<script>window.parent.document.getElementById('{selected_draft_obj['_anchor']}')?.scrollIntoView();</script>"
+                st.components.v1.html(js, height=0)
+                st.session_state.pending_scroll = None
+            # Candidate summary
+            st.markdown("#### Candidate Summary")
+            col1, col2 = st.columns(2)
+            with col1:
+                st.markdown(f"**Name:** {pii_data.get('full_name', 'N/A')}")
+                st.markdown(f"**Current Role:** {selected_draft_obj['_role']}")
+                st.markdown(f"**Location:** {selected_draft_obj['_loc']}")
+            with col2:
+                st.markdown(f"**Email:** {pii_data.get('email', 'N/A')}")
+                st.markdown(f"**Phone:** {pii_data.get('phone', 'N/A')}")
+            
+            # Without the stored body, the editors would start empty and saving would overwrite it
+            if draft_body is not None:
                 # Outreach message
                 st.markdown("#### Outreach Message")
                 outreach_message = st.text_area(
                     "Message:",
-                    value=selected_draft_obj['outreach_message'],
+                    value=draft_body.get('outreach_message'),
                     height=150
                 )
-                
+            
                 # Screening questions
                 st.markdown("#### Screening Questions")
                 screening_questions = st.text_area(
                     "Questions:",
-                    value=selected_draft_obj['screening_questions'],
+                    value=draft_body.get('screening_questions'),
                     height=100
                 )
-                
+            
                 # Save changes and move to tracker
                 col1, col2 = st.columns(2)
                 with col1:
@@ -408,22 +481,23 @@ def main():
                                 'screening_questions': screening_questions,
                                 'updated_at': datetime.now(UTC).isoformat()
                             }
-                            
+                        
                             response = supabase.table('recruiter_notes')\
                                 .update(data)\
                                 .eq('id', selected_draft_obj['id'])\
                                 .execute()
-                            
+                        
                             if hasattr(response, 'error') and response.error:
                                 st.error(f"Error saving changes: {response.error}")
                             else:
                                 st.success("Changes saved successfully!")
-                                st.session_state.refresh_key = time.time()
+                                fetch_draft_body.clear()
+                                fetch_drafts.clear()
                                 st.rerun()
-                                
+                            
                         except Exception as e:
                             st.error(f"Error saving changes: {str(e)}")
-                
+            
                 with col2:
                     if st.button("✅ Mark as Contacted", key=f"contact_selected_{selected_draft_obj['id']}"):
                         try:
@@ -435,64 +509,65 @@ def main():
                                 'follow_up_date': selected_draft_obj.get('follow_up_date'),
                                 'updated_at': datetime.now(UTC).isoformat()
                             }
-                            
+                        
                             response = supabase.table('recruiter_notes')\
                                 .update(data)\
                                 .eq('id', selected_draft_obj['id'])\
                                 .execute()
-                            
+                        
                             if hasattr(response, 'error') and response.error:
                                 st.error(f"Error marking as contacted: {response.error}")
                             else:
                                 st.success("Candidate moved to tracker!")
-                                st.session_state.refresh_key = time.time()
+                                fetch_draft_body.clear()
+                                fetch_drafts.clear()
                                 st.rerun()
-                                
+                            
                         except Exception as e:
                             st.error(f"Error marking as contacted: {str(e)}")
+            
+            # Update follow-up status
+            with st.form(key=f"update_followup_selected_{selected_draft_obj['id']}"):
+                st.markdown("#### Update Follow-up Status")
+                new_follow_up_required = st.checkbox("Follow-up Required", value=selected_draft_obj.get('follow_up_required', False))
+                new_follow_up_date = st.date_input(
+                    "Follow-up Date",
+                    value=pd.to_datetime(selected_draft_obj.get('follow_up_date')).date() if selected_draft_obj.get('follow_up_date') else None
+                )
                 
-                # Update follow-up status
-                with st.form(key=f"update_followup_selected_{selected_draft_obj['id']}"):
-                    st.markdown("#### Update Follow-up Status")
-                    new_follow_up_required = st.checkbox("Follow-up Required", value=selected_draft_obj.get('follow_up_required', False))
-                    new_follow_up_date = st.date_input(
-                        "Follow-up Date",
-                        value=pd.to_datetime(selected_draft_obj.get('follow_up_date')).date() if selected_draft_obj.get('follow_up_date') else None
-                    )
-                    
-                    if st.form_submit_button("Update Follow-up Status"):
-                        try:
-                            # Convert the date to ISO format with timezone
-                            if new_follow_up_date:
-                                follow_up_date = pd.to_datetime(new_follow_up_date).tz_localize('UTC').isoformat()
-                            else:
-                                follow_up_date = None
-                                
-                            data = {
-                                'follow_up_required': new_follow_up_required,
-                                'follow_up_date': follow_up_date,
-                                'updated_at': datetime.now(UTC).isoformat()
-                            }
+                if st.form_submit_button("Update Follow-up Status"):
+                    try:
+                        # Convert the date to ISO format with timezone
+                        if new_follow_up_date:
+                            follow_up_date = pd.to_datetime(new_follow_up_date).tz_localize('UTC').isoformat()
+                        else:
+                            follow_up_date = None
                             
-                            response = supabase.table('recruiter_notes')\
-                                .update(data)\
-                                .eq('id', selected_draft_obj['id'])\
-                                .execute()
+                        data = {
+                            'follow_up_required': new_follow_up_required,
+                            'follow_up_date': follow_up_date,
+                            'updated_at': datetime.now(UTC).isoformat()
+                        }
+                        
+                        response = supabase.table('recruiter_notes')\
+                            .update(data)\
+                            .eq('id', selected_draft_obj['id'])\
+                            .execute()
+                        
+                        if hasattr(response, 'error') and response.error:
+                            st.error(f"Error updating follow-up status: {response.error}")
+                        else:
+                            st.success("Follow-up status updated successfully!")
+                            fetch_drafts.clear()
+                            st.rerun()
                             
-                            if hasattr(response, 'error') and response.error:
-                                st.error(f"Error updating follow-up status: {response.error}")
-                            else:
-                                st.success("Follow-up status updated successfully!")
-                                st.session_state.refresh_key = time.time()
-                                st.rerun()
-                                
-                        except Exception as e:
-                            st.error(f"Error updating follow-up status: {str(e)}")
-                
-                # Timestamps
-                st.markdown(f"*Created: {format_timestamp(selected_draft_obj['created_at'])}*")
-                if selected_draft_obj.get('updated_at'):
-                    st.markdown(f"*Last Updated: {format_timestamp(selected_draft_obj['updated_at'])}*")
+                    except Exception as e:
+                        st.error(f"Error updating follow-up status: {str(e)}")
+            
+            # Timestamps
+            st.markdown(f"*Created: {format_timestamp(selected_draft_obj['created_at'])}*")
+            if selected_draft_obj.get('updated_at'):
+                st.markdown(f"*Last Updated: {format_timestamp(selected_draft_obj['updated_at'])}*")
 
     # Divider for the rest
     st.markdown("---")
@@ -500,42 +575,49 @@ def main():
 
     # Display remaining drafts
     for draft in drafts:
-        resume = draft.get('resumes', {})
-        pii_data = resume.get('resumes_pii', [{}])[0] if resume.get('resumes_pii') else {}
-        full_name = str(pii_data.get('full_name', '') or '')
-        anchor_id = slugify(full_name)
-        if anchor_id == st.session_state.selected_draft:
+        if draft is selected_draft_obj:
             continue  # Already shown above
+        pii_data = draft['_pii']
+        full_name = draft['_name']
+
+        st.markdown(f'<div id="{draft["_anchor"]}"></div>', unsafe_allow_html=True)
+        # Only the open draft builds its widgets; the others cost a single toggle button
+        is_open = st.session_state.open_draft_id == draft['id']
+        if st.button(f"👤 {full_name or 'N/A'} - {draft['_role']}", key=f"toggle_{draft['id']}", use_container_width=True):
+            st.session_state.open_draft_id = None if is_open else draft['id']
+            st.rerun()
 
-        with st.expander(f"👤 {full_name or 'N/A'} - {resume.get('current_or_last_job_title', 'N/A')}", expanded=False):
+        if is_open:
             # Candidate summary
             st.markdown("#### Candidate Summary")
             col1, col2 = st.columns(2)
             with col1:
                 st.markdown(f"**Name:** {pii_data.get('full_name', 'N/A')}")
-                st.markdown(f"**Current Role:** {resume.get('current_or_last_job_title', 'N/A')}")
-                st.markdown(f"**Location:** {resume.get('location', 'N/A')}")
+                st.markdown(f"**Current Role:** {draft['_role']}")
+                st.markdown(f"**Location:** {draft['_loc']}")
             with col2:
                 st.markdown(f"**Email:** {pii_data.get('email', 'N/A')}")
                 st.markdown(f"**Phone:** {pii_data.get('phone', 'N/A')}")
             
             # Last outreach message
-            st.markdown("#### Last Outreach Message")
-            st.text_area(
-                "Message:",
-                value=draft['outreach_message'],
-                height=150,
-                key=f"message_{draft['id']}_selected"
-            )
+            draft_body = get_draft_body(draft['id'])
+            if draft_body is not None:
+                st.markdown("#### Last Outreach Message")
+                st.text_area(
+                    "Message:",
+                    value=draft_body.get('outreach_message'),
+                    height=150,
+                    key=f"message_{draft['id']}_selected"
+                )
 
-            # Screening questions
-            st.markdown("#### Screening Questions")
-            st.text_area(
-                "Questions:",
-                value=draft['screening_questions'],
-                height=100,
-                key=f"questions_{draft['id']}_selected"
-            )
+                # Screening questions
+                st.markdown("#### Screening Questions")
+                st.text_area(
+                    "Questions:",
+                    value=draft_body.get('screening_questions'),
+                    height=100,
+                    key=f"questions_{draft['id']}_selected"
+                )
 
             # Follow-up status
             st.markdown("#### Follow-up Status")
@@ -573,7 +655,7 @@ def main():
                             st.error(f"Error updating follow-up status: {response.error}")
                         else:
                             st.success("Follow-up status updated successfully!")
-                            st.session_state.refresh_key = time.time()
+                            fetch_drafts.clear()
                             st.rerun()
 
                     except Exception as e:
@@ -608,5 +690,13 @@ def main():
                     st.session_state.selected_draft = None
                     st.rerun()
 
+        # Warm the cache for the next page while the user reads this one, so "Next" is a cache hit
+        if st.session_state.drafts_page < total_pages:
+            prefetch_drafts(
+                recruiter_id,
+                st.session_state.drafts_page + 1,
+                st.session_state.drafts_per_page
+            )
+
 if __name__ == "__main__":
     main() 
\ No newline at end of file
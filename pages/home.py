@@ -1,26 +1,24 @@
 import streamlit as st
-from supabase import create_client, Client
-import os
-from dotenv import load_dotenv
+import json
 import pandas as pd
-import plotly.express as px
-from collections import Counter
+import plotly.graph_objects as go
+import plotly.colors as pc
+import concurrent.futures
 from functools import lru_cache
 import time
-from datetime import datetime, UTC
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from backend.db import get_supabase_client, load_env, SUPABASE_URL, SUPABASE_SERVICE_KEY, PROFILE_COLUMNS
+from backend.dashboard import DashboardBundle
 
 # Load environment variables
-load_dotenv()
+load_env()
 
-# Check if environment variables are loaded
-supabase_url = os.environ.get("SUPABASE_URL")
-supabase_key = os.environ.get("SUPABASE_KEY")
+# Fragments arrived as st.experimental_fragment in Streamlit 1.33; on older versions
+# the dashboard simply reruns with the rest of the page
+fragment = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', None) or (lambda func: func)
 
-# Initialize Supabase client
-supabase: Client = create_client(
-    supabase_url=supabase_url,
-    supabase_key=supabase_key
-)
+# The latest uploads for Recent Activity, with the name from resumes_pii
+RECENT_CANDIDATE_COLUMNS = 'current_or_last_job_title, location, created_at, resumes_pii(full_name)'
 
 def initialize_session_state():
     """Initialize session state variables"""
@@ -32,260 +30,248 @@ def initialize_session_state():
         st.session_state.page = None
     if 'dashboard_initialized' not in st.session_state:
         st.session_state.dashboard_initialized = False
-    if 'refresh_key' not in st.session_state:
-        st.session_state.refresh_key = time.time()
+    if 'dashboard_version' not in st.session_state:
+        st.session_state.dashboard_version = 0
 
-@st.cache_data(ttl=300, show_spinner=False)
-def get_user_profile(refresh_key=None):
-    """Get user profile from Supabase"""
+# Raises on an error or a missing row so neither is cached
+@st.cache_data(ttl=600, show_spinner=False)
+def _fetch_profile(user_id):
+    """Fetch the user's profile row, cached per user"""
+    supabase_admin = get_supabase_client()
+    profile_response = supabase_admin.table('user_profiles').select(PROFILE_COLUMNS).eq('user_id', user_id).maybe_single().execute()
+    
+    # maybe_single returns the row itself, or no data when there is none
+    if not profile_response or not profile_response.data:
+        raise LookupError(f"No profile for user {user_id}")
+    return profile_response.data
+
+def get_user_profile(user_id, default_profile):
+    """Get user profile from Supabase, creating the default one if it is missing; raises on errors"""
+    if not user_id:
+        print("❌ No user_id in session state")
+        return None
+    
     try:
-        # Get user ID from session state
-        if not st.session_state.get('user_id'):
-            print("❌ No user_id in session state")
-            return None
-        
-        user_id = st.session_state.user_id
-        
-        # Create service role client with explicit headers
-        supabase_admin = create_client(
-            supabase_url=os.environ.get("SUPABASE_URL"),
-            supabase_key=os.environ.get("SUPABASE_SERVICE_ROLE_KEY")
-        )
-        
-        # Set the headers explicitly
-        supabase_admin.postgrest.headers = {
-            "apikey": os.environ.get("SUPABASE_SERVICE_ROLE_KEY"),
-            "Authorization": f"Bearer {os.environ.get('SUPABASE_SERVICE_ROLE_KEY')}"
-        }
-        
-        # Get the profile data using service role client
-        profile_response = supabase_admin.table('user_profiles').select('*').eq('user_id', user_id).execute()
-        
-        if profile_response.data:
-            return profile_response.data[0]
-        
-        # If no profile exists, create a default profile
-        default_profile = {
-            'user_id': user_id,
-            'full_name': st.session_state.user_email.split('@')[0],
-            'company': '',
-            'role': '',
-            'phone': '',
-            'linkedin': '',
-            'created_at': datetime.now(UTC).isoformat(),
-            'updated_at': datetime.now(UTC).isoformat()
-        }
-        
-        # Insert default profile using service role client
-        insert_response = supabase_admin.table('user_profiles').insert(default_profile).execute()
-        if insert_response.data:
-            return insert_response.data[0]
-        
-        return default_profile
-    except Exception as e:
-        st.error(f"Error fetching profile: {str(e)}")
+        return _fetch_profile(user_id)
+    except LookupError:
+        pass
+    
+    # If no profile exists, fall back to the default profile built at login
+    if not default_profile:
         return None
+    
+    # Insert default profile using service role client; login may be writing it concurrently
+    supabase_admin = get_supabase_client()
+    insert_response = supabase_admin.table('user_profiles')\
+        .upsert(default_profile, on_conflict='user_id', ignore_duplicates=True)\
+        .execute()
+    if insert_response.data:
+        return insert_response.data[0]
+    
+    return default_profile
 
-@st.cache_data(ttl=300, show_spinner=False)
-def get_candidate_metrics(refresh_key=None):
-    """Get summary metrics using direct query"""
-    try:
-        # Direct query approach
-        response = supabase.table('resumes').select('*').execute()
-        candidates = response.data
-        
-        if not candidates:
-            st.warning("No candidates found in the database")
-            return None
-            
-        # Process data
-        total_candidates = len(candidates)
-        
-        # Process job titles
-        job_titles = [c['current_or_last_job_title'] for c in candidates if c['current_or_last_job_title']]
-        job_title_counts = dict(Counter(job_titles))
-        top_job_titles = Counter(job_titles).most_common(3)
-        
-        # Process skills
-        all_skills = []
-        for c in candidates:
-            if c.get('skills'):
-                all_skills.extend(c['skills'])
-        skill_counts = dict(Counter(all_skills))
-        most_common_skill = Counter(all_skills).most_common(1)[0][0] if all_skills else "No skills found"
-        
-        # Process locations
-        locations = [c['location'] for c in candidates if c['location']]
-        location_counts = dict(Counter(locations))
-        top_location = Counter(locations).most_common(1)[0][0] if locations else "No location found"
-        
-        # Get recent candidates
-        recent_candidates = sorted(
-            candidates,
-            key=lambda x: x['created_at'],
-            reverse=True
-        )[:5]
-        
-        return {
-            'total_candidates': total_candidates,
-            'top_job_titles': top_job_titles,
-            'most_common_skill': most_common_skill,
-            'top_location': top_location,
-            'candidates': recent_candidates,
-            'job_title_counts': job_title_counts,
-            'location_counts': location_counts,
-            'skill_counts': skill_counts
-        }
-    except Exception as e:
-        st.error(f"Error fetching metrics: {str(e)}")
+def metrics_time_bucket():
+    """Current 5-minute window; stands in for ttl on the disk-persisted metrics cache"""
+    return int(time.time() // 300)
+
+# The dashboard builders below also run on Home's prefetch threads, so they only return
+# or raise; render_dashboard reports problems from the script thread
+def get_candidate_metrics():
+    """Get summary metrics aggregated in Postgres by get_dashboard_metrics(), or None when there are no candidates"""
+    supabase = get_supabase_client()
+    response = supabase.rpc('get_dashboard_metrics', {}).execute()
+    data = response.data
+
+    if not data or not data.get('total_candidates'):
         return None
 
-@st.cache_data(ttl=300, show_spinner=False)
-def create_job_title_chart(metrics, refresh_key=None):
-    """Create job title chart with cached data"""
-    try:
-        if 'job_title_counts' in metrics:
-            job_title_counts = metrics['job_title_counts'] or {}
-        else:
-            job_titles = [c.get('current_or_last_job_title') for c in metrics.get('candidates', []) 
-                         if isinstance(c, dict) and c.get('current_or_last_job_title')]
-            job_title_counts = dict(Counter(job_titles))
-        
-        if not job_title_counts:
-            return px.bar(title='No Job Title Data Available')
-            
-        df = pd.DataFrame({
-            'Job Title': list(job_title_counts.keys()),
-            'Count': list(job_title_counts.values())
-        })
-        
-        df = df.sort_values('Count', ascending=False).head(10)
-        
-        fig = px.bar(
-            df,
-            x='Job Title',
-            y='Count',
-            title='Top 10 Job Titles',
-            color='Count',
-            color_continuous_scale='Viridis'
-        )
-        
-        fig.update_layout(
-            xaxis_tickangle=-45,
-            xaxis_title='Job Title',
-            yaxis_title='Number of Candidates',
-            showlegend=False,
-            height=500,
-            margin=dict(b=100)
-        )
-        
-        fig.update_traces(
-            marker_line_width=0,
-            marker_line_color='white'
+    # Counts arrive as top-N dicts already ordered by count, highest first
+    job_title_counts = data.get('job_title_counts') or {}
+    skill_counts = data.get('skill_counts') or {}
+    location_counts = data.get('location_counts') or {}
+
+    return {
+        'total_candidates': data['total_candidates'],
+        'top_job_titles': list(job_title_counts.items())[:3],
+        'most_common_skill': next(iter(skill_counts), "No skills found"),
+        'top_location': next(iter(location_counts), "No location found"),
+        'job_title_counts': job_title_counts,
+        'location_counts': location_counts,
+        'skill_counts': skill_counts
+    }
+
+def create_count_bar(counts, title, x_title):
+    """Build a Viridis bar chart straight from pre-aggregated (label, count) pairs"""
+    labels, values = zip(*counts)
+    # Sample the colors once here so the browser has no colorscale or colorbar to lay out
+    max_value = max(values)
+    colors = pc.sample_colorscale('Viridis', [value / max_value for value in values])
+    fig = go.Figure(go.Bar(
+        x=labels,
+        y=values,
+        marker=dict(
+            color=colors,
+            line=dict(width=0, color='white')
         )
+    ))
+    
+    fig.update_layout(
+        title=title,
+        xaxis_tickangle=-45,
+        xaxis_title=x_title,
+        yaxis_title='Number of Candidates',
+        showlegend=False,
+        height=500,
+        margin=dict(b=100),
+        uirevision='static'
+    )
+    return fig
+
+def create_job_title_chart(job_title_counts):
+    """Create job title chart as Plotly JSON"""
+    if not job_title_counts:
+        return go.Figure(layout=dict(title='No Job Title Data Available')).to_json()
         
-        return fig
-    except Exception as e:
-        st.error(f"Error creating job title chart: {str(e)}")
-        return px.bar(title='Error Loading Job Title Data')
-
-@st.cache_data(ttl=300, show_spinner=False)
-def create_location_chart(metrics, refresh_key=None):
-    """Create location chart with cached data"""
-    try:
-        if 'location_counts' in metrics:
-            location_counts = metrics['location_counts'] or {}
-        else:
-            locations = [c.get('location') for c in metrics.get('candidates', []) 
-                        if isinstance(c, dict) and c.get('location')]
-            location_counts = dict(Counter(locations))
+    return create_count_bar(job_title_counts.items(), 'Top 10 Job Titles', 'Job Title').to_json()
+
+def create_location_chart(location_counts):
+    """Create location chart as Plotly JSON"""
+    if not location_counts:
+        return go.Figure(layout=dict(title='No Location Data Available')).to_json()
         
-        if not location_counts:
-            return px.pie(title='No Location Data Available')
-            
-        df = pd.DataFrame({
-            'Location': list(location_counts.keys()),
-            'Count': list(location_counts.values())
-        })
-        fig = px.pie(df, values='Count', names='Location', title='Candidates by Location')
-        return fig
-    except Exception as e:
-        st.error(f"Error creating location chart: {str(e)}")
-        return px.pie(title='Error Loading Location Data')
-
-@st.cache_data(ttl=300, show_spinner=False)
-def create_skill_chart(metrics, refresh_key=None):
-    """Create skill chart with cached data"""
-    try:
-        if 'skill_counts' in metrics:
-            skill_counts = metrics['skill_counts'] or {}
-        else:
-            all_skills = []
-            for c in metrics.get('candidates', []):
-                if isinstance(c, dict) and c.get('skills'):
-                    all_skills.extend(c['skills'])
-            skill_counts = dict(Counter(all_skills))
+    fig = go.Figure(go.Pie(
+        labels=list(location_counts.keys()),
+        values=list(location_counts.values())
+    ))
+    fig.update_layout(title='Candidates by Location', uirevision='static')
+    return fig.to_json()
+
+def create_skill_chart(skill_counts):
+    """Create skill chart as Plotly JSON"""
+    if not skill_counts:
+        return go.Figure(layout=dict(title='No Skills Data Available')).to_json()
         
-        if not skill_counts:
-            return px.bar(title='No Skills Data Available')
+    return create_count_bar(skill_counts.items(), 'Top 15 Skills', 'Skill').to_json()
+
+# Kept in memory only: candidate names are PII and must not land in the disk cache
+@st.cache_data(max_entries=2, show_spinner=False)
+def get_recent_candidates(time_bucket):
+    """Get the five latest uploads as a typed DataFrame"""
+    supabase = get_supabase_client()
+    response = supabase.table('resumes')\
+        .select(RECENT_CANDIDATE_COLUMNS)\
+        .order('created_at', desc=True)\
+        .limit(5)\
+        .execute()
+
+    recent_candidates = []
+    for row in response.data or []:
+        pii = (row.pop('resumes_pii', None) or [{}])[0] or {}
+        recent_candidates.append({**row, 'full_name': pii.get('full_name')})
+
+    df = pd.DataFrame.from_records(
+        recent_candidates,
+        columns=['full_name', 'current_or_last_job_title', 'location', 'created_at']
+    )
+    # Explicit dtypes let Streamlit take the fast Arrow path; dates are formatted in the browser
+    return pd.DataFrame({
+        'Name': df['full_name'].astype('string').fillna('N/A'),
+        'Job Title': df['current_or_last_job_title'].astype('string').fillna('N/A'),
+        'Location': df['location'].astype('string').fillna('N/A'),
+        'Upload Date': pd.to_datetime(df['created_at'], errors='coerce', utc=True, format='ISO8601')
+    })
+
+# Persisted to disk so a restarted server starts warm. Streamlit ignores ttl for
+# persisted caches, so expiry comes from the time_bucket argument instead.
+@st.cache_data(persist='disk', max_entries=2, show_spinner=False)
+def build_dashboard(time_bucket):
+    """Fetch the metrics and build every chart in a single cache entry"""
+    metrics = get_candidate_metrics()
+    if not metrics:
+        return None
+
+    return DashboardBundle(
+        metrics=metrics,
+        fig_jobs=create_job_title_chart(metrics['job_title_counts']),
+        fig_loc=create_location_chart(metrics['location_counts']),
+        fig_skills=create_skill_chart(metrics['skill_counts'])
+    )
+
+@fragment
+def render_dashboard():
+    """Render the dashboard section; its own widgets rerun only this fragment"""
+    st.markdown("---")
+    st.subheader("📊 Quick Look at Your Candidate Portfolio")
+    
+    # Add refresh button; the whole dashboard bundle is rebuilt from fresh metrics
+    if st.button("🔄 Refresh Dashboard"):
+        build_dashboard.clear()
+        get_recent_candidates.clear()
+        st.session_state.dashboard_version += 1
+
+    # Keep the bundle and its parsed figures in session state and rebuild them only
+    # when the metrics window or version changes, skipping the cache hash on plain reruns
+    dashboard_key = (metrics_time_bucket(), st.session_state.dashboard_version)
+    if st.session_state.get('dashboard_key') != dashboard_key:
+        bundle = None
+        with st.spinner('Loading dashboard data...'):
+            try:
+                bundle = build_dashboard(dashboard_key[0])
+                recent = get_recent_candidates(dashboard_key[0]) if bundle else None
+            except Exception as e:
+                # Failures are not cached, so the next run retries them
+                bundle = None
+                st.error(f"Error loading dashboard: {str(e)}")
+                st.info("Please try refreshing the page or logging in again.")
+        if bundle:
+            st.session_state.dashboard = bundle
+            st.session_state.dashboard_charts = {
+                'jobs': json.loads(bundle.fig_jobs),
+                'locations': json.loads(bundle.fig_loc),
+                'skills': json.loads(bundle.fig_skills)
+            }
+            st.session_state.dashboard_recent = recent
+            st.session_state.dashboard_key = dashboard_key
+    else:
+        bundle = st.session_state.dashboard
+    
+    # Show dashboard content if we have data
+    if bundle:
+        metrics = bundle.metrics
+        charts = st.session_state.dashboard_charts
+
+        # Summary Metrics
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric("Total Candidates", metrics['total_candidates'])
+        with col2:
+            st.metric("Top Location", metrics['top_location'])
             
-        top_skills = dict(sorted(skill_counts.items(), key=lambda x: x[1], reverse=True)[:15])
-        
-        df = pd.DataFrame({
-            'Skill': list(top_skills.keys()),
-            'Count': list(top_skills.values())
-        })
-        
-        fig = px.bar(
-            df,
-            x='Skill',
-            y='Count',
-            title='Top 15 Skills',
-            color='Count',
-            color_continuous_scale='Viridis'
-        )
-        
-        fig.update_layout(
-            xaxis_tickangle=-45,
-            xaxis_title='Skill',
-            yaxis_title='Number of Candidates',
-            showlegend=False,
-            height=500,
-            margin=dict(b=100)
-        )
+        # Charts - Load them lazily
+        st.subheader("📊 Analytics")
+        chart_col1, chart_col2 = st.columns(2)
         
-        fig.update_traces(
-            marker_line_width=0,
-            marker_line_color='white'
+        with chart_col1:
+            with st.spinner('Loading job title chart...'):
+                st.plotly_chart(charts['jobs'], use_container_width=True)
+            with st.spinner('Loading location chart...'):
+                st.plotly_chart(charts['locations'], use_container_width=True)
+                
+        with chart_col2:
+            with st.spinner('Loading skills chart...'):
+                st.plotly_chart(charts['skills'], use_container_width=True)
+                
+        # Recent Activity
+        st.subheader("🕒 Recent Activity")
+        st.dataframe(
+            st.session_state.dashboard_recent,
+            use_container_width=True,
+            column_config={
+                "Upload Date": st.column_config.DateColumn("Upload Date", format="YYYY-MM-DD")
+            }
         )
-        
-        return fig
-    except Exception as e:
-        st.error(f"Error creating skill chart: {str(e)}")
-        return px.bar(title='Error Loading Skills Data')
-
-@st.cache_data(ttl=300, show_spinner=False)
-def get_recent_candidates(metrics, refresh_key=None):
-    """Get recent candidates with cached data"""
-    try:
-        if isinstance(metrics.get('candidates'), list) and len(metrics['candidates']) > 0 and isinstance(metrics['candidates'][0], dict):
-            recent_candidates = metrics['candidates']
-        else:
-            recent_candidates = metrics.get('candidates', []) or []
-        
-        if not recent_candidates:
-            return pd.DataFrame(columns=['Name', 'Job Title', 'Location', 'Upload Date'])
-            
-        df = pd.DataFrame([{
-            'Name': c.get('full_name', 'N/A'),
-            'Job Title': c.get('current_or_last_job_title', 'N/A'),
-            'Location': c.get('location', 'N/A'),
-            'Upload Date': pd.to_datetime(c.get('created_at')).strftime('%Y-%m-%d') if c.get('created_at') else 'N/A'
-        } for c in recent_candidates])
-        return df
-    except Exception as e:
-        st.error(f"Error getting recent candidates: {str(e)}")
-        return pd.DataFrame(columns=['Name', 'Job Title', 'Location', 'Upload Date'])
+    else:
+        st.warning("No candidate data available. Please upload some resumes first.")
 
 def main():
     st.set_page_config(
@@ -295,24 +281,15 @@ def main():
     )
     
     # Debug information after page config
-    if not supabase_url or not supabase_key:
+    if not SUPABASE_URL or not SUPABASE_SERVICE_KEY:
         st.error("Missing Supabase credentials. Please check your environment variables.")
         st.stop()
 
-    # Test Supabase connection
-    try:
-        supabase.auth.get_user()
-    except Exception as e:
-        st.error(f"Error connecting to Supabase: {str(e)}")
-        st.stop()
-    
     # Initialize session state
     initialize_session_state()
     
-    # Force refresh on first load or when coming from login
     if st.session_state.page != "Home":
         st.session_state.page = "Home"
-        st.session_state.refresh_key = time.time()
         st.session_state.dashboard_initialized = False
     
     # Check if user is authenticated
@@ -323,8 +300,44 @@ def main():
             st.switch_page("pages/login.py")
         return
 
-    # Get user profile
-    profile = get_user_profile(st.session_state.get("refresh_key"))
+    # Resumes uploaded since the last visit make the cached metrics stale
+    if st.session_state.get('dashboard_stale'):
+        build_dashboard.clear()
+        get_recent_candidates.clear()
+        st.session_state.dashboard_version += 1
+        st.session_state.dashboard_stale = False
+
+    # Likewise a profile edited on the profile page
+    if st.session_state.get('profile_stale'):
+        _fetch_profile.clear()
+        st.session_state.profile_stale = False
+
+    # Reuse the profile row login prefetched (or the profile page saved) when it is ours
+    profile = st.session_state.get('user_profile')
+    if not profile or profile.get('user_id') != st.session_state.get('user_id'):
+        profile = None
+
+    # Warm the dashboard caches only when render_dashboard is going to rebuild from them;
+    # on plain reruns it reads the bundle straight from session state
+    time_bucket = metrics_time_bucket()
+    dashboard_cold = st.session_state.get('dashboard_key') != (time_bucket, st.session_state.dashboard_version)
+
+    # Get user profile and dashboard metrics concurrently; they are independent round trips
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=3,
+        initializer=add_script_run_ctx,
+        initargs=(None, get_script_run_ctx())
+    ) as executor:
+        if not profile:
+            profile_future = executor.submit(get_user_profile, st.session_state.get('user_id'), st.session_state.get('default_profile'))
+        if dashboard_cold:
+            executor.submit(build_dashboard, time_bucket)
+            executor.submit(get_recent_candidates, time_bucket)
+    if not profile:
+        try:
+            profile = profile_future.result()
+        except Exception as e:
+            st.error(f"Error fetching profile: {str(e)}")
     if not profile:
         st.error("Error loading profile. Please try logging in again.")
         if st.button("Go to Login"):
@@ -348,7 +361,6 @@ def main():
                 st.session_state.user_email = None
                 st.session_state.dashboard_initialized = False
                 st.session_state.page = "Login"
-                st.session_state.refresh_key = time.time()
                 st.switch_page("pages/login.py")
 
     # Create three columns for different sections
@@ -392,53 +404,7 @@ def main():
         st.switch_page("pages/candidate_tracker.py")
 
     # Dashboard Section - Always show when on home page
-    st.markdown("---")
-    st.subheader("📊 Quick Look at Your Candidate Portfolio")
-    
-    # Add refresh button
-    if st.button("🔄 Refresh Dashboard"):
-        st.session_state.refresh_key = time.time()
-        st.rerun()
-    
-    # Always attempt to load dashboard data
-    metrics = None
-    with st.spinner('Loading dashboard data...'):
-        try:
-            metrics = get_candidate_metrics(st.session_state.get("refresh_key"))
-        except Exception as e:
-            st.error(f"Error loading dashboard: {str(e)}")
-            st.info("Please try refreshing the page or logging in again.")
-    
-    # Show dashboard content if we have data
-    if metrics:
-        # Summary Metrics
-        col1, col2 = st.columns(2)
-        with col1:
-            st.metric("Total Candidates", metrics['total_candidates'])
-        with col2:
-            st.metric("Top Location", metrics['top_location'])
-            
-        # Charts - Load them lazily
-        st.subheader("📊 Analytics")
-        chart_col1, chart_col2 = st.columns(2)
-        
-        with chart_col1:
-            with st.spinner('Loading job title chart...'):
-                st.plotly_chart(create_job_title_chart(metrics, st.session_state.get("refresh_key")), use_container_width=True)
-            with st.spinner('Loading location chart...'):
-                st.plotly_chart(create_location_chart(metrics, st.session_state.get("refresh_key")), use_container_width=True)
-                
-        with chart_col2:
-            with st.spinner('Loading skills chart...'):
-                st.plotly_chart(create_skill_chart(metrics, st.session_state.get("refresh_key")), use_container_width=True)
-                
-        # Recent Activity
-        st.subheader("🕒 Recent Activity")
-        with st.spinner('Loading recent candidates...'):
-            recent_candidates = get_recent_candidates(metrics, st.session_state.get("refresh_key"))
-            st.dataframe(recent_candidates, use_container_width=True)
-    else:
-        st.warning("No candidate data available. Please upload some resumes first.")
+    render_dashboard()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
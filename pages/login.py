@@ -1,51 +1,30 @@
 import streamlit as st
-from supabase import create_client, Client
+from supabase import Client
 from postgrest import PostgrestClient
 import os
-from dotenv import load_dotenv
 from datetime import datetime, UTC
 import logging
+import threading
+from functools import lru_cache
+from streamlit.runtime.scriptrunner import add_script_run_ctx
+from backend.db import get_supabase_client, get_anon_supabase_client, load_env, PROFILE_COLUMNS
 
 # Load environment variables
-load_dotenv()
+load_env()
 
-# Initialize base Supabase client (for login only)
-supabase: Client = create_client(
-    supabase_url=os.environ.get("SUPABASE_URL"),
-    supabase_key=os.environ.get("SUPABASE_KEY")
-)
-
-logger = logging.getLogger(__name__)
+# Base Supabase client (for login only), shared across reruns and sessions
+supabase: Client = get_anon_supabase_client()
 
-def get_authed_supabase(access_token: str, refresh_token: str = None) -> Client:
-    """Create an authenticated Supabase client using the access token"""
-    try:
-        # Create client with the token in the headers
-        client = create_client(
-            supabase_url=os.environ.get("SUPABASE_URL"),
-            supabase_key=os.environ.get("SUPABASE_KEY")
-        )
-        
-        # Set the session with both access token and refresh token
-        client.auth.set_session(access_token, refresh_token or access_token)
-        
-        # Set the auth header for subsequent requests
-        client.auth.headers = {
-            "Authorization": f"Bearer {access_token}",  # critical for RLS
-            "apikey": os.environ.get("SUPABASE_KEY")
-        }
-        
-        # Test auth.uid() recognition
-        try:
-            test_response = client.table('user_profiles').select('auth.uid()').execute()
-            print("🔍 Auth.uid() test response:", test_response)
-        except Exception as e:
-            print("⚠️ Auth.uid() test failed:", str(e))
-        
-        return client
-    except Exception as e:
-        logger.error(f"Error creating authenticated client: {str(e)}")
-        raise
+# Configure logging; basicConfig is a no-op if another page already set up the root logger
+logging.basicConfig(
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+# LOG_LEVEL applies to this page's logger itself, so it holds whichever page configured
+# the root first. WARNING unless it asks for more, so debug calls stay no-ops;
+# getLevelName maps a known name to its number and anything else falls back to WARNING.
+logger = logging.getLogger("skillq.login")
+log_level = logging.getLevelName(os.environ.get("LOG_LEVEL", "WARNING").upper())
+logger.setLevel(log_level if isinstance(log_level, int) else logging.WARNING)
 
 def initialize_session_state():
     """Initialize session state variables"""
@@ -55,58 +34,61 @@ def initialize_session_state():
         st.session_state.user_email = None
     if 'user_id' not in st.session_state:
         st.session_state.user_id = None
+    if 'default_profile' not in st.session_state:
+        st.session_state.default_profile = None
+    if 'user_profile' not in st.session_state:
+        st.session_state.user_profile = None
 
-def create_user_profile(user_id: str, email: str, access_token: str, refresh_token: str = None) -> bool:
-    """Create a user profile in Supabase if it doesn't exist"""
+@lru_cache(maxsize=1024)
+def _local_part(email: str) -> str:
+    """Local part of an email address, used as the default display name"""
+    return email.split('@', 1)[0]
+
+def build_default_profile(user_id: str, email: str) -> dict:
+    """Build the profile a new user starts with"""
+    now_iso = datetime.now(UTC).isoformat()
+    return {
+        'user_id': user_id,
+        'full_name': _local_part(email),
+        'company': '',
+        'role': '',
+        'phone': '',
+        'linkedin': '',
+        'created_at': now_iso,
+        'updated_at': now_iso
+    }
+
+def create_user_profile(default_profile: dict) -> dict:
+    """Create a user profile in Supabase if it doesn't exist and return the stored row; safe to run off the script thread"""
     try:
-        print(f"🔧 Creating service role client for user: {user_id}")
-        # Create service role client for profile creation
-        supabase_admin = create_client(
-            supabase_url=os.environ.get("SUPABASE_URL"),
-            supabase_key=os.environ.get("SUPABASE_SERVICE_ROLE_KEY")  # Use service role key
-        )
-        
-        # Debug prints for auth context
-        print("🔑 Access Token (first 20 chars):", access_token[:20])
-        if refresh_token:
-            print("🔄 Refresh Token (first 20 chars):", refresh_token[:20])
-        print("👤 user_id:", user_id)
-        
-        # Check if profile exists using service role client
-        profile_response = supabase_admin.table('user_profiles').select('*').eq('user_id', user_id).execute()
-        print("🔍 Profile check response:", profile_response)
+        logger.debug("Creating profile if missing for user_id=%s", default_profile['user_id'])
+        # Reuse the process-wide service role client instead of opening a new connection per login
+        supabase_admin = get_supabase_client()
         
-        if profile_response and hasattr(profile_response, 'data') and profile_response.data:
-            print("✅ Profile already exists.")
-            return True
+        # Insert the default profile unless one already exists; a single round trip,
+        # relying on the UNIQUE(user_id) constraint instead of a prior existence check
+        upsert_response = supabase_admin.table('user_profiles')\
+            .upsert(default_profile, on_conflict='user_id', ignore_duplicates=True)\
+            .execute()
+        logger.debug("Profile upsert response: %s", upsert_response)
+        if upsert_response.data:
+            return upsert_response.data[0]
 
-        # Create default profile using service role client
-        default_profile = {
-            'user_id': user_id,
-            'full_name': email.split('@')[0],
-            'company': '',
-            'role': '',
-            'phone': '',
-            'linkedin': '',
-            'created_at': datetime.now(UTC).isoformat(),
-            'updated_at': datetime.now(UTC).isoformat()
-        }
+        # The row already existed, which ignore_duplicates reports as no data; read it back
+        profile_response = supabase_admin.table('user_profiles').select(PROFILE_COLUMNS).eq('user_id', default_profile['user_id']).maybe_single().execute()
+        return profile_response.data if profile_response and profile_response.data else default_profile
 
-        print("🔧 Attempting to insert profile with service role...")
-        insert_response = supabase_admin.table('user_profiles').insert(default_profile).execute()
-        print("✅ Insert response:", insert_response)
-        
-        if insert_response and hasattr(insert_response, 'data') and insert_response.data:
-            print("✅ Profile created successfully")
-            return True
-        else:
-            print("❌ Profile creation failed - no data returned")
-            return False
+    except Exception:
+        logger.exception("Error managing user profile")
+        return None
 
-    except Exception as e:
-        st.error(f"Error managing user profile: {str(e)}")
-        print("❌ Full error details:\n", e)
-        return False
+def prefetch_user_profile(default_profile: dict):
+    """Ensure the profile row and keep it in session state so the profile page opens without a query"""
+    profile = create_user_profile(default_profile)
+    if profile:
+        st.session_state.user_profile = profile
+        # Only a successful upsert skips the check on the next login; a failed one is retried
+        st.session_state[f"profile_ok:{default_profile['user_id']}"] = True
 
 def main():
     st.set_page_config(
@@ -132,53 +114,52 @@ def main():
         
         if submit:
             try:
-                print(f"🔐 Attempting login for: {email}")
-                
                 # Attempt to sign in with Supabase
                 response = supabase.auth.sign_in_with_password({
                     "email": email,
                     "password": password
                 })
                 
-                # Debug logging
-                print("🧪 Full login response:", response)
-                print("🧪 Response type:", type(response))
-                
                 # Defensive null checking
                 if response is None or response.user is None or response.session is None:
-                    print("❌ Login failed: Incomplete response")
+                    logger.debug("Login failed: incomplete response")
                     st.error("Invalid email or password")
                     return
                 
                 user_id = response.user.id
-                access_token = response.session.access_token
-                refresh_token = response.session.refresh_token
                 
-                print(f"✅ Login successful. User ID: {user_id}")
+                logger.debug("Login successful for user_id=%s", user_id)
                 
                 # Set session state before profile creation
                 st.session_state.authenticated = True
                 st.session_state.user_email = email
                 st.session_state.user_id = user_id
+                # Built once here; Home falls back to it instead of rebuilding it per render
+                st.session_state.default_profile = build_default_profile(user_id, email)
+
+                # Ensure and prefetch the profile row off the request path; it is an idempotent
+                # upsert and Home falls back to the default profile until it lands
+                if not st.session_state.get(f"profile_ok:{user_id}"):
+                    st.session_state.user_profile = None
+                    profile_thread = threading.Thread(
+                        target=prefetch_user_profile,
+                        args=(st.session_state.default_profile,),
+                        daemon=True
+                    )
+                    add_script_run_ctx(profile_thread)
+                    profile_thread.start()
 
-                if create_user_profile(user_id, email, access_token, refresh_token):
-                    st.success("Login successful!")
-                    st.switch_page("pages/home.py")
-                else:
-                    print("❌ Failed to create profile")
-                    st.error("Failed to create user profile. Please try again.")
-                    # Reset session state on failure
-                    st.session_state.authenticated = False
-                    st.session_state.user_email = None
-                    st.session_state.user_id = None
+                st.success("Login successful!")
+                st.switch_page("pages/home.py")
                     
             except Exception as e:
-                print(f"🔥 Login exception: {e}")
+                logger.exception("Login failed")
                 st.error(f"Login failed: {str(e)}")
                 # Reset session state on error
                 st.session_state.authenticated = False
                 st.session_state.user_email = None
                 st.session_state.user_id = None
+                st.session_state.default_profile = None
     
     # Add signup link
     st.markdown("---")
@@ -1,17 +1,15 @@
 import streamlit as st
-from supabase import create_client, Client
-import os
-from dotenv import load_dotenv
-from datetime import datetime, UTC
+from backend.db import get_supabase_client, load_env, PROFILE_COLUMNS
 
 # Load environment variables
-load_dotenv()
+load_env()
 
-# Initialize Supabase client
-supabase: Client = create_client(
-    supabase_url=os.environ.get("SUPABASE_URL"),
-    supabase_key=os.environ.get("SUPABASE_KEY")
-)
+# Fragments arrived as st.experimental_fragment in Streamlit 1.33; on older versions
+# the form simply reruns with the rest of the page
+fragment = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', None) or (lambda func: func)
+
+# Profile fields edited on this page
+PROFILE_FIELDS = ('full_name', 'company', 'role', 'phone', 'linkedin')
 
 def initialize_session_state():
     """Initialize session state variables"""
@@ -24,6 +22,13 @@ def initialize_session_state():
     if 'profile_updated' not in st.session_state:
         st.session_state.profile_updated = False
 
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_profile(user_id):
+    """Fetch the stored profile row for a user, or None if there is none"""
+    supabase_admin = get_supabase_client()
+    profile_response = supabase_admin.table('user_profiles').select(PROFILE_COLUMNS).eq('user_id', user_id).maybe_single().execute()
+    return profile_response.data if profile_response else None
+
 def get_user_profile():
     """Get user profile from Supabase with error handling"""
     try:
@@ -32,44 +37,21 @@ def get_user_profile():
             print("❌ No user_id in session state")
             return None
 
-        # Create service role client with explicit headers
-        supabase_admin = create_client(
-            supabase_url=os.environ.get("SUPABASE_URL"),
-            supabase_key=os.environ.get("SUPABASE_SERVICE_ROLE_KEY")
-        )
-        
-        # Set the headers explicitly
-        supabase_admin.postgrest.headers = {
-            "apikey": os.environ.get("SUPABASE_SERVICE_ROLE_KEY"),
-            "Authorization": f"Bearer {os.environ.get('SUPABASE_SERVICE_ROLE_KEY')}"
-        }
+        # Login prefetches the profile into session state and a fetch below keeps it
+        # there, so form reruns return here without querying
+        cached_profile = st.session_state.get('user_profile')
+        if cached_profile and cached_profile.get('user_id') == st.session_state.user_id:
+            return cached_profile
 
         # Get the profile data using the session state user_id
-        profile_response = supabase_admin.table('user_profiles').select('*').eq('user_id', st.session_state.user_id).execute()
-        
-        if profile_response.data:
-            return profile_response.data[0]
-        
-        # If no profile exists, create a default one
-        default_profile = {
-            'user_id': st.session_state.user_id,
-            'full_name': st.session_state.user_email.split('@')[0],
-            'company': '',
-            'role': '',
-            'phone': '',
-            'linkedin': '',
-            'created_at': datetime.now(UTC).isoformat(),
-            'updated_at': datetime.now(UTC).isoformat()
-        }
+        profile = _fetch_profile(st.session_state.user_id)
         
-        # Insert the default profile using service role client
-        insert_response = supabase_admin.table('user_profiles').insert(default_profile).execute()
+        if profile:
+            st.session_state.user_profile = profile
+            return st.session_state.user_profile
         
-        if insert_response.data:
-            return insert_response.data[0]
-        else:
-            st.error("Failed to create default profile")
-            return None
+        # The on_auth_user_created trigger creates every profile, so a miss means no account
+        return None
             
     except Exception as e:
         st.error(f"Error fetching profile: {str(e)}")
@@ -86,23 +68,23 @@ def update_user_profile(profile_data):
         
         user_id = st.session_state.user_id
         
-        # Create service role client with explicit headers
-        supabase_admin = create_client(
-            supabase_url=os.environ.get("SUPABASE_URL"),
-            supabase_key=os.environ.get("SUPABASE_SERVICE_ROLE_KEY")
-        )
+        # Use the shared service role client
+        supabase_admin = get_supabase_client()
         
-        # Set the headers explicitly
-        supabase_admin.postgrest.headers = {
-            "apikey": os.environ.get("SUPABASE_SERVICE_ROLE_KEY"),
-            "Authorization": f"Bearer {os.environ.get('SUPABASE_SERVICE_ROLE_KEY')}"
-        }
-        
-        # Update the profile using service role client
-        update_response = supabase_admin.table('user_profiles').update(profile_data).eq('user_id', user_id).execute()
+        # Update only the changed fields; the row exists since login ensures it, and an
+        # upsert of a partial payload would try to insert a row missing the other columns
+        update_response = supabase_admin.table('user_profiles')\
+            .update(profile_data)\
+            .eq('user_id', user_id)\
+            .execute()
         
         if update_response.data:
             st.session_state.profile_updated = True
+            # Keep the saved row in memory so the form refreshes without a re-fetch
+            st.session_state.user_profile = update_response.data[0]
+            _fetch_profile.clear()
+            # Home caches the profile per user; have it refetch on the next visit
+            st.session_state.profile_stale = True
             return True
         else:
             st.error("Failed to update profile")
@@ -112,6 +94,40 @@ def update_user_profile(profile_data):
         st.error(f"Error updating profile: {str(e)}")
         return False
 
+@fragment
+def render_profile_form(profile):
+    """Render the profile form; submitting it reruns only this fragment"""
+    # Seed the form's session state keys from the profile once; the widgets own the values after that
+    for field in PROFILE_FIELDS:
+        if f"profile_{field}" not in st.session_state:
+            st.session_state[f"profile_{field}"] = profile.get(field) or ''
+
+    # Create form for profile update
+    with st.form("profile_form"):
+        st.text_input("Full Name", key="profile_full_name")
+        st.text_input("Company", key="profile_company")
+        st.text_input("Role", key="profile_role")
+        st.text_input("Phone", key="profile_phone")
+        st.text_input("LinkedIn Profile", key="profile_linkedin")
+        
+        submitted = st.form_submit_button("Update Profile")
+        
+        if submitted:
+            # Send only the fields that differ from the stored profile; updated_at is
+            # stamped by the user_profiles trigger
+            saved_profile = st.session_state.get('user_profile') or profile
+            profile_data = {
+                field: st.session_state[f"profile_{field}"]
+                for field in PROFILE_FIELDS
+                if st.session_state[f"profile_{field}"] != (saved_profile.get(field) or '')
+            }
+            
+            # The inputs already hold the saved values, so no page rerun is needed
+            if not profile_data:
+                st.info("No changes to save")
+            elif update_user_profile(profile_data):
+                st.success("Profile updated successfully!")
+
 def main():
     st.set_page_config(
         page_title="SkillQ - Profile",
@@ -133,6 +149,13 @@ def main():
         st.session_state.page = "Home"
         st.switch_page("pages/home.py")
 
+    # The Logout button renders at the bottom, but act on its click here so
+    # leaving the page does not fetch the profile first
+    if st.session_state.get('profile_logout'):
+        st.session_state.authenticated = False
+        st.session_state.user_email = None
+        st.switch_page("pages/login.py")
+
     st.title("👤 Profile Settings")
     st.write(f"Welcome, {st.session_state.get('user_email', 'User')}!")
 
@@ -146,36 +169,11 @@ def main():
             st.switch_page("pages/login.py")
         return
 
-    # Create form for profile update
-    with st.form("profile_form"):
-        full_name = st.text_input("Full Name", value=profile.get('full_name', ''))
-        company = st.text_input("Company", value=profile.get('company', ''))
-        role = st.text_input("Role", value=profile.get('role', ''))
-        phone = st.text_input("Phone", value=profile.get('phone', ''))
-        linkedin = st.text_input("LinkedIn Profile", value=profile.get('linkedin', ''))
-        
-        submitted = st.form_submit_button("Update Profile")
-        
-        if submitted:
-            profile_data = {
-                'full_name': full_name,
-                'company': company,
-                'role': role,
-                'phone': phone,
-                'linkedin': linkedin,
-                'updated_at': datetime.now(UTC).isoformat()
-            }
-            
-            if update_user_profile(profile_data):
-                st.success("Profile updated successfully!")
-                st.rerun()
+    render_profile_form(profile)
 
     # Add a logout button at the bottom
     st.markdown("---")
-    if st.button("Logout"):
-        st.session_state.authenticated = False
-        st.session_state.user_email = None
-        st.switch_page("pages/login.py")
+    st.button("Logout", key="profile_logout")
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
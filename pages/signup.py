@@ -1,19 +1,14 @@
 import streamlit as st
 from supabase import create_client, Client
 from postgrest import PostgrestClient
-import os
-from dotenv import load_dotenv
-from datetime import datetime, UTC
 import logging
+from backend.db import get_anon_supabase_client, load_env, SUPABASE_URL, SUPABASE_KEY
 
 # Load environment variables
-load_dotenv()
+load_env()
 
-# Initialize Supabase client
-supabase: Client = create_client(
-    supabase_url=os.environ.get("SUPABASE_URL"),
-    supabase_key=os.environ.get("SUPABASE_KEY")
-)
+# Base Supabase client (for sign up only), shared across reruns and sessions
+supabase: Client = get_anon_supabase_client()
 
 logger = logging.getLogger(__name__)
 
@@ -22,16 +17,16 @@ def get_authed_supabase(access_token: str) -> Client:
     try:
         # Create client with the token in the headers
         client = create_client(
-            supabase_url=os.environ.get("SUPABASE_URL"),
-            supabase_key=os.environ.get("SUPABASE_KEY")
+            supabase_url=SUPABASE_URL,
+            supabase_key=SUPABASE_KEY
         )
         # Set the auth header
         client.auth.set_session(access_token, "")
         # Override the postgrest client to include the auth token
         client.postgrest = PostgrestClient(
-            f"{os.environ.get('SUPABASE_URL')}/rest/v1",
+            f"{SUPABASE_URL}/rest/v1",
             headers={
-                "apikey": os.environ.get("SUPABASE_KEY"),
+                "apikey": SUPABASE_KEY,
                 "Authorization": f"Bearer {access_token}"
             }
         )
@@ -52,7 +47,7 @@ def initialize_session_state():
         st.session_state.needs_verification = False
 
 def signup_user(email: str, password: str) -> bool:
-    """Sign up a user and create a profile in user_profiles"""
+    """Sign up a user; Postgres creates their user_profiles row"""
     try:
         print(f"🔧 Starting signup process for: {email}")
         
@@ -79,36 +74,8 @@ def signup_user(email: str, password: str) -> bool:
                 st.info("Please check your email to verify your account before logging in.")
                 return True
 
-            print("🔧 Creating service role client...")
-            # Create service role client for profile creation
-            supabase_admin = create_client(
-                supabase_url=os.environ.get("SUPABASE_URL"),
-                supabase_key=os.environ.get("SUPABASE_SERVICE_ROLE_KEY")  # Use service role key
-            )
-            print("✅ Service role client created successfully")
-
-            # Build profile
-            default_profile = {
-                'user_id': user_id,
-                'full_name': email.split('@')[0],
-                'company': '',
-                'role': '',
-                'phone': '',
-                'linkedin': '',
-                'created_at': datetime.now(UTC).isoformat(),
-                'updated_at': datetime.now(UTC).isoformat()
-            }
-
-            print("🔧 Attempting to insert profile with service role...")
-            # Insert profile using service role client
-            insert_response = supabase_admin.table('user_profiles').insert(default_profile).execute()
-            if insert_response.data:
-                print("✅ Profile created successfully.")
-                return True
-            else:
-                print("❌ Profile creation failed")
-                st.error("Signup succeeded, but profile creation failed.")
-                return False
+            # The default profile is created by the on_auth_user_created trigger
+            return True
         else:
             print("❌ Signup failed: No user returned")
             st.error("Signup failed: No user returned.")
@@ -16,6 +16,11 @@ logger = logging.getLogger(__name__)
 # Add backend directory to Python path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
+from backend.db import get_supabase_client, load_env
+
+# Load environment variables
+load_env()
+
 def get_session(key, default=None):
     """Helper function for lazy session state initialization"""
     if key not in st.session_state:
@@ -23,15 +28,11 @@ def get_session(key, default=None):
     return st.session_state[key]
 
 # Lazy imports with minimal caching
-@st.cache_resource(max_entries=5)  # Limit to 5 instances
-def get_supabase_client():
-    from backend.supabase_client import SupabaseClient
-    return SupabaseClient()
-
 @st.cache_resource(max_entries=5)  # Limit to 5 instances
 def get_resume_processor():
     from backend.resume_processor import ResumeProcessor
-    return ResumeProcessor()
+    # Store resumes through the shared service role client instead of opening another one
+    return ResumeProcessor(supabase_client=get_supabase_client())
 
 # Initialize session state
 def initialize_session_state():
@@ -251,6 +252,8 @@ def main():
                     )
                     if result:
                         st.success(f"Successfully processed {uploaded_file.name}!")
+                        # Let the home dashboard know its cached metrics are out of date
+                        st.session_state.dashboard_stale = True
                         # Set reset flag for the uploader
                         get_session('reset_single_upload', True)
                         st.rerun()
@@ -277,6 +280,10 @@ def main():
                     if failed_files:
                         st.warning(f"Failed to process: {', '.join(failed_files)}")
                     
+                    if success_count:
+                        # Let the home dashboard know its cached metrics are out of date
+                        st.session_state.dashboard_stale = True
+                    
                     # Set reset flag for the uploader
                     get_session('reset_bulk_upload', True)
                     st.rerun()